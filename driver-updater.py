@@ -24,10 +24,15 @@ import sys
 import subprocess
 import re
 import os
-from typing import Optional, List, Dict, Any
+import time
+from shutil import which
+from typing import Optional, List, Dict, Any, Tuple
 
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QThread, Slot
-from PySide6.QtGui import QAction, QColor, QFont, QPainter, QPen, QBrush, QIcon
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QObject, QThread, Slot, QMetaObject, Q_ARG,
+    QAbstractListModel, QModelIndex, QEvent, QRect, QSize,
+)
+from PySide6.QtGui import QAction, QColor, QFont, QPainter, QPen, QBrush, QIcon, QTextCursor, QFontMetrics
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -45,79 +50,203 @@ from PySide6.QtWidgets import (
     QStyle,
     QMessageBox,
     QStackedWidget,
-    QScrollArea,
+    QListView,
+    QAbstractItemView,
+    QStyledItemDelegate,
+)
+
+
+# Package names considered driver-related in the `apt list --upgradable` fallback
+_DRIVER_PATTERNS = (
+    'driver', 'firmware', 'linux-(?:modules|image|headers)', 'nvidia', 'amd', 'intel', 'vulkan', 'mesa',
 )
+_RE_DRIVER = re.compile('|'.join(_DRIVER_PATTERNS), re.IGNORECASE)
+# Same patterns as a `grep -Ei` expression, anchored to the package name (text before the first "/")
+_GREP_DRIVER_PATTERN = '^[^/]*(' + '|'.join(p.replace('(?:', '(') for p in _DRIVER_PATTERNS) + ')'
+# One `apt list --upgradable` line: "pkg/suite version arch [upgradable from: version]"
+_RE_UPG_LINE = re.compile(
+    r'^(?P<pkg>[^/\s]+)/\S+\s+(?P<ver>\S+)\s+\S+(?:\s+\[upgradable from:\s+(?P<cur>[^\]]+)\])?'
+)
+
+# ScanWorker log batching: flush after this many lines or seconds, whichever comes first.
+# The check only runs when a new line is logged (leading-edge batching, no timer), so a
+# partial batch waits for the next line, the next progress update or the end of the scan.
+_LOG_BATCH_LINES = 32
+_LOG_FLUSH_INTERVAL = 0.05
+
+# How long quitting waits for each scan thread after stopping it
+_SCAN_SHUTDOWN_TIMEOUT_MS = 3000
+
+
+_APP_ICON: Optional[QIcon] = None
+
+
+def _get_app_icon() -> QIcon:
+    """Returns the application icon, loading icon.png from disk only once per process."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path = os.path.join(os.path.dirname(__file__), "icon.png")  # Ganti dengan icon.svg jika perlu
+        if os.path.exists(icon_path):
+            _APP_ICON = QIcon(icon_path)
+        else:
+            _APP_ICON = QApplication.style().standardIcon(QStyle.SP_ComputerIcon)
+    return _APP_ICON
+
+
+# dpkg states in which a package has no installed version (apt's current_ver is empty)
+_DPKG_NOT_INSTALLED = ("not-installed", "config-files")
+
+
+def _installed_versions(pkgs: List[str]) -> Dict[str, Optional[str]]:
+    """Returns {package: installed version or None} using one `dpkg-query` call."""
+    proc = subprocess.run(
+        ["dpkg-query", "-W", "-f=${Package}\\t${Version}\\t${db:Status-Status}\\n", *pkgs],
+        capture_output=True, text=True,
+    )
+    # Exit status 1 only means some packages are unknown to dpkg
+    if proc.returncode >= 2:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, proc.stdout, proc.stderr)
+    versions: Dict[str, Optional[str]] = {}
+    for line in proc.stdout.splitlines():
+        pkg, version, status = line.split("\t")
+        if status not in _DPKG_NOT_INSTALLED:
+            versions[pkg] = version
+        else:
+            # Multiarch prints one line per architecture; never let one clobber an installed one
+            versions.setdefault(pkg, None)
+    return versions
+
+
+def _probe_installed(pkgs: List[str]) -> Dict[str, Optional[str]]:
+    """Returns {package: installed version, "(none)" or None if unknown} in a single probe."""
+    apt_cache = _open_apt_cache()
+    if apt_cache is None:
+        # Only the installed version matters here, which dpkg-query already answers
+        versions = _installed_versions(pkgs)
+        return {pkg: versions.get(pkg) or "(none)" for pkg in pkgs}
+
+    installed = {}
+    for pkg in pkgs:
+        try:
+            p = apt_cache[pkg]
+        except KeyError:
+            installed[pkg] = None
+            continue
+        installed[pkg] = p.current_ver.ver_str if p.current_ver else "(none)"
+    return installed
+
+
+def _open_apt_cache():
+    """Opens an apt_pkg cache, or returns None if python-apt is not available."""
+    try:
+        import apt_pkg  # type: ignore
+        apt_pkg.init()
+        return apt_pkg.Cache(None)
+    except Exception:
+        return None
 
 
 class ScanWorker(QObject):
     """
     Runs driver scanning in a separate thread to keep the UI responsive.
     """
-    progress = Signal(int, str)
-    log = Signal(str)
-    finished = Signal(list)
-    error = Signal(str)
+    # Every signal carries the generation id of the scan that emitted it
+    progress = Signal(int, int, str)
+    log = Signal(int, str)
+    finished = Signal(int, list)
+    error = Signal(int, str)
     _is_running = True
 
-    def run_scan(self) -> None:
-        """Performs the complete scanning process."""
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._log_buf: List[str] = []
+        self._last_flush = time.monotonic()
+        self._detect = None
+        self._detect_error: Optional[Exception] = None
+        self._apt_pkg = None
+        self._generation = 0
+        # Running child processes, so stop() can terminate them from the GUI thread
+        self._children: List[subprocess.Popen] = []
+
+    @Slot(int)
+    def run_scan(self, generation: int) -> None:
+        """Performs the complete scanning process for the scan identified by `generation`."""
+        self._generation = generation
         self._is_running = True
         try:
             # 1) Try to use detect.py module (ubuntu-drivers-common) if available
             try:
-                import importlib
-                detect_module = importlib.import_module('detect')
-                # Ensure apt_pkg is available for detect.py
-                import apt_pkg  # type: ignore
-                apt_pkg.init()
-                self.log.emit("Using detect.py module for driver detection.")
+                detect_module = self._load_detect()
+                self._log("Using detect.py module for driver detection.")
                 self.run_detect_scan(detect_module)
                 return
             except Exception as de:
-                self.log.emit(f"detect.py could not be used: {de}\nContinuing with fallback method...")
+                self._log(f"detect.py could not be used: {de}\nContinuing with fallback method...")
 
             # 2) Fallback to apt scanning if detect.py is not available
-            self.log.emit("Using 'apt' method as fallback.")
+            self._log("Using 'apt' method as fallback.")
             self.run_apt_scan()
         except Exception as e:
-            self.error.emit(f"Unexpected error occurred: {str(e)}")
+            self._flush_log()
+            self.error.emit(self._generation, f"Unexpected error occurred: {str(e)}")
+        finally:
+            self._flush_log()
+
+    def _load_detect(self):
+        """Imports detect.py and initializes apt_pkg on the first scan; later scans reuse them."""
+        if self._detect_error is not None:
+            raise self._detect_error
+        if self._detect is None:
+            try:
+                import importlib
+                # Ensure apt_pkg is available for detect.py
+                import apt_pkg  # type: ignore
+                apt_pkg.init()
+                self._detect = importlib.import_module('detect')
+                self._apt_pkg = apt_pkg
+            except Exception as e:
+                self._detect_error = e
+                raise
+        return self._detect
 
     def run_detect_scan(self, detect_module) -> None:
         """Scanning based on detect.py module for Ubuntu systems."""
         if not self._is_running:
             return
-        self.progress.emit(10, "Analyzing devices and driver candidates...")
+        self._set_progress(10, "Analyzing devices and driver candidates...")
 
         updates_found = []
+        # Load the apt cache once; detect.py and the version lookups below share it
+        cache = self._apt_pkg.Cache(None)
+        depcache = self._apt_pkg.DepCache(cache)
         try:
             # Get package -> device info map from detect.py
-            packages = detect_module.system_driver_packages()
+            packages = detect_module.system_driver_packages(cache)
         except Exception as e:
-            self.log.emit(f"Failed to run system_driver_packages(): {e}")
+            self._log(f"Failed to run system_driver_packages(): {e}")
             packages = {}
 
         if not self._is_running:
             return
-        self.progress.emit(40, "Checking installed vs candidate package versions...")
+        self._set_progress(40, "Checking installed vs candidate package versions...")
 
-        def _policy(pkg: str):
-            proc = self._run_command(["apt-cache", "policy", pkg])
-            installed = None
-            candidate = None
-            if proc.stdout:
-                m_inst = re.search(r"Installed:\s*([^\n]+)", proc.stdout)
-                m_cand = re.search(r"Candidate:\s*([^\n]+)", proc.stdout)
-                installed = m_inst.group(1).strip() if m_inst else None
-                candidate = m_cand.group(1).strip() if m_cand else None
-            return installed, candidate
+        def _policy(p) -> Tuple[str, Optional[str]]:
+            installed = p.current_ver.ver_str if p.current_ver else "(none)"
+            candidate = depcache.get_candidate_ver(p)
+            return installed, (candidate.ver_str if candidate else None)
 
-        # Build upgrade list for packages that are installed but have a newer candidate version
+        # Build upgrade list for packages that are installed but have a newer candidate version.
+        # DepCache compares the versions natively (and treats uninstalled packages as upgradable too).
         for pkg, meta in packages.items():
             if not self._is_running:
                 return
-            self.log.emit(f"Checking package: {pkg}")
-            installed, candidate = _policy(pkg)
-            if installed and candidate and installed != candidate and installed != "(none)":
+            self._log(f"Checking package: {pkg}")
+            try:
+                p = cache[pkg]
+            except KeyError:
+                continue
+            if p.current_ver and depcache.is_upgradable(p):
+                installed, candidate = _policy(p)
                 updates_found.append({
                     "package": pkg,
                     "vendor": meta.get("vendor", ""),
@@ -126,99 +255,160 @@ class ScanWorker(QObject):
                     "new_version": candidate,
                     "type": "detect"
                 })
-                self.log.emit(f"-> Update found: {pkg} {installed} -> {candidate}")
+                self._log(f"-> Update found: {pkg} {installed} -> {candidate}")
 
         # If nothing to upgrade, suggest recommended packages for installation
         if not updates_found:
-            self.progress.emit(70, "Looking for recommended packages to install...")
+            self._set_progress(70, "Looking for recommended packages to install...")
             try:
-                import apt_pkg as _apt_pkg  # type: ignore
-                _apt_pkg.init()
-                cache = _apt_pkg.Cache(None)
                 to_install = detect_module.get_desktop_package_list(cache)
             except Exception:
                 to_install = []
 
+            # get_desktop_package_list() only returns packages that are not installed yet
             for pkg in to_install:
-                installed, candidate = _policy(pkg)
+                try:
+                    installed, candidate = _policy(cache[pkg])
+                except KeyError:
+                    installed, candidate = "(none)", None
                 meta = packages.get(pkg, {})
-                if installed == "(none)" or installed is None:
-                    updates_found.append({
-                        "package": pkg,
-                        "vendor": meta.get("vendor", ""),
-                        "model": meta.get("model", ""),
-                        "current_version": installed or "(none)",
-                        "new_version": candidate or "", 
-                        "type": "detect-recommended"
-                    })
-                    self.log.emit(f"-> Recommended for installation: {pkg} (candidate {candidate or 'unknown'})")
+                updates_found.append({
+                    "package": pkg,
+                    "vendor": meta.get("vendor", ""),
+                    "model": meta.get("model", ""),
+                    "current_version": installed,
+                    "new_version": candidate or "",
+                    "type": "detect-recommended"
+                })
+                self._log(f"-> Recommended for installation: {pkg} (candidate {candidate or 'unknown'})")
 
         if not updates_found:
-            self.log.emit("No updates or recommended installations found by detect.py.")
+            self._log("No updates or recommended installations found by detect.py.")
 
-        self.progress.emit(100, "Scan complete")
-        self.finished.emit(updates_found)
+        if not self._is_running:
+            return
+        self._set_progress(100, "Scan complete")
+        self.finished.emit(self._generation, updates_found)
 
     # The ubuntu-drivers method is removed; detection now relies entirely on detect.py
 
     def run_apt_scan(self):
         """Fallback scanning method using `apt list --upgradable`."""
         if not self._is_running: return
-        self.log.emit("Running 'pkexec apt update' to refresh package list...")
-        self.progress.emit(10, "Refreshing package list...")
+        self._log("Running 'pkexec apt update' to refresh package list...")
+        self._set_progress(10, "Refreshing package list...")
 
         update_proc = self._run_command(["pkexec", "apt", "update"], capture_output=True)
         if update_proc.returncode != 0:
             err_msg = update_proc.stderr.strip() if update_proc.stderr else "Permission denied or error occurred during 'apt update'."
-            self.error.emit(f"Failed to update package list.\n{err_msg}")
+            self._flush_log()
+            self.error.emit(self._generation, f"Failed to update package list.\n{err_msg}")
             return
 
         if not self._is_running: return
-        self.log.emit("Package list updated successfully.")
-        self.progress.emit(40, "Checking upgradable packages...")
-        upg_proc = self._run_command(["apt", "list", "--upgradable"], check=True)
-
-        driver_regex = r'driver|firmware|linux-(?:modules|image|headers)|nvidia|amd|intel|vulkan|mesa'
-        upgradable_lines = upg_proc.stdout.splitlines()[1:]  # Skip header
+        self._log("Package list updated successfully.")
+        self._set_progress(40, "Checking upgradable packages...")
         updates_found = []
 
-        for line in upgradable_lines:
-            if not self._is_running: return
-            if re.search(driver_regex, line, re.IGNORECASE):
-                parts = line.split()
-                package = parts[0].split('/')[0]
-                new_version = parts[1]
-
-                current_version = "N/A"
-                installed_match = re.search(r'\[upgradable from: ([^\]]+)\]', line)
-                if installed_match:
-                    current_version = installed_match.group(1)
+        # Stream the output so filtering and cancellation happen as lines arrive.
+        # When grep is available it pre-filters the lines, so Python only sees driver packages.
+        upg_proc = subprocess.Popen(["apt", "list", "--upgradable"], stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        grep_proc = None
+        if self._is_command_available("grep"):
+            grep_proc = subprocess.Popen(["grep", "-Ei", _GREP_DRIVER_PATTERN], stdin=upg_proc.stdout,
+                                         stdout=subprocess.PIPE, text=True, bufsize=1)
+            upg_proc.stdout.close()  # grep is the only reader of apt's output now
+        self._children.extend(p for p in (upg_proc, grep_proc) if p is not None)
+        try:
+            for line in (grep_proc or upg_proc).stdout:
+                if not self._is_running:
+                    return
+                m = _RE_UPG_LINE.match(line)  # Also rejects the "Listing..." header
+                if not m or (grep_proc is None and not _RE_DRIVER.search(m.group('pkg'))):
+                    continue
+                package = m.group('pkg')
 
                 updates_found.append({
                     "package": package,
-                    "new_version": new_version,
-                    "current_version": current_version,
+                    "new_version": m.group('ver'),
+                    "current_version": m.group('cur') or "N/A",
                     "type": "apt"
                 })
-                self.log.emit(f"- Ditemukan potensi pembaruan: {package}")
+                self._log(f"- Ditemukan potensi pembaruan: {package}")
+        finally:
+            for proc in (grep_proc, upg_proc):
+                if proc is None:
+                    continue
+                if not self._is_running:
+                    proc.kill()
+                proc.stdout.close()
+                proc.wait()
+                self._children.remove(proc)
+
+        if upg_proc.returncode != 0:
+            raise subprocess.CalledProcessError(upg_proc.returncode, upg_proc.args)
+        # grep exits with 1 when nothing matched; 2 and above is a real error
+        if grep_proc is not None and grep_proc.returncode >= 2:
+            raise subprocess.CalledProcessError(grep_proc.returncode, grep_proc.args)
+
+        if not self._is_running:
+            return
+        self._set_progress(100, "Pemindaian selesai")
+        self.finished.emit(self._generation, updates_found)
+
+    def _log(self, msg: str) -> None:
+        """Buffers a log line; lines are sent to the GUI in batches to avoid flooding its event loop.
+
+        Must only be called from the worker thread; see _LOG_FLUSH_INTERVAL for when batches go out.
+        """
+        self._log_buf.append(msg)
+        if len(self._log_buf) >= _LOG_BATCH_LINES or time.monotonic() - self._last_flush >= _LOG_FLUSH_INTERVAL:
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        if self._log_buf:
+            self.log.emit(self._generation, "\n".join(self._log_buf))
+            self._log_buf.clear()
+        self._last_flush = time.monotonic()
 
-        self.progress.emit(100, "Pemindaian selesai")
-        self.finished.emit(updates_found)
+    def _set_progress(self, value: int, text: str) -> None:
+        # Phase changes often precede slow work, so show pending log lines first
+        self._flush_log()
+        self.progress.emit(self._generation, value, text)
 
     def _is_command_available(self, cmd: str) -> bool:
         """Memeriksa apakah sebuah perintah tersedia di PATH sistem."""
-        return subprocess.run(["which", cmd], capture_output=True, text=True).returncode == 0
+        return which(cmd) is not None
 
     def _run_command(self, cmd: list, check: bool = False, capture_output: bool = True) -> subprocess.CompletedProcess:
         """Wrapper untuk menjalankan subprocess dengan penanganan interupsi."""
         if not self._is_running:
             raise InterruptedError("Process interrupted by user.")
-        return subprocess.run(cmd, capture_output=capture_output, text=True, check=check)
+        pipe = subprocess.PIPE if capture_output else None
+        proc = subprocess.Popen(cmd, stdout=pipe, stderr=pipe, text=True)
+        self._children.append(proc)
+        try:
+            if not self._is_running:  # stop() ran before the child was registered
+                proc.terminate()
+            stdout, stderr = proc.communicate()
+        finally:
+            self._children.remove(proc)
+        if check and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
 
     @Slot()
     def stop(self):
-        self.log.emit("Received signal to stop...")
+        # Called from the GUI thread: only flip the flag. The stop notice is logged by the
+        # window, since output of a cancelled scan is discarded by its generation id.
         self._is_running = False
+        # Don't leave the scan blocked in a child (e.g. pkexec waiting for a password)
+        for proc in list(self._children):
+            try:
+                proc.terminate()
+            except OSError:
+                pass
 
 
 class UpdateWorker(QObject):
@@ -226,23 +416,26 @@ class UpdateWorker(QObject):
     log = Signal(str)
     finished = Signal(bool, str) # success, message
 
-    def run_update(self, packages: List[str]) -> None:
+    def run_update(self, packages: List[str], policy_cache: Optional[Dict[str, Tuple[str, str]]] = None) -> None:
         """Runs `apt install`/upgrade for the selected packages.
         If any package is not installed, remove --only-upgrade so the package can be installed.
+        Versions already known from the scan (policy_cache) are reused instead of queried again.
         """
         try:
             pkg_str = " ".join(packages)
             self.log.emit(f"Starting update for: {pkg_str}")
 
-            def _is_installed(pkg: str) -> bool:
+            policy_cache = policy_cache or {}
+            installed_map = {p: policy_cache[p][0] for p in packages if p in policy_cache}
+            misses = [p for p in packages if p not in installed_map]
+            if misses:
                 try:
-                    p = subprocess.run(["apt-cache", "policy", pkg], capture_output=True, text=True)
-                    m = re.search(r"Installed:\s*([^\n]+)", p.stdout)
-                    return bool(m and m.group(1).strip() and m.group(1).strip() != "(none)")
+                    installed_map.update(_probe_installed(misses))
                 except Exception:
-                    return True  # konservatif: anggap terpasang agar tidak meng-install tanpa perlu
+                    pass  # konservatif: paket yang gagal diperiksa dianggap terpasang
 
-            any_not_installed = any(not _is_installed(p) for p in packages)
+            # Packages missing from installed_map could not be checked and count as installed
+            any_not_installed = any(installed_map.get(p, "") in (None, "(none)") for p in packages)
 
             base_cmd = ["pkexec", "apt", "install", "-y"]
             if not any_not_installed:
@@ -280,6 +473,21 @@ class CircularScanButton(QWidget):
         self.setMaximumSize(self._diameter, self._diameter)
         self.setCursor(Qt.PointingHandCursor)
 
+        # Painting objects are cached and rebuilt only when accent or size changes
+        self._inner_brush = QBrush(self._inner_color)
+        self._text_pen = QPen(self._text_color)
+        self._update_pens()
+        self._update_geometry()
+
+    def _update_pens(self) -> None:
+        self._glow_pen = QPen(self._ring_glow, 18, Qt.SolidLine, Qt.RoundCap)
+        self._ring_pen = QPen(self._ring_color, 10, Qt.SolidLine, Qt.RoundCap)
+
+    def _update_geometry(self) -> None:
+        d = min(self.width(), self.height())
+        self._radii = ((d - 18) // 2, (d - 36) // 2, (d - 72) // 2)
+        self._font = QFont("Arial", max(18, int(d * 0.1)), QFont.Bold)
+
     def setText(self, text: str) -> None:
         self._text = text
         self.update()
@@ -287,31 +495,36 @@ class CircularScanButton(QWidget):
     def setAccent(self, ring: QColor, glow: Optional[QColor] = None) -> None:
         self._ring_color = ring
         self._ring_glow = glow if glow else ring
+        self._update_pens()
         self.update()
 
+    def resizeEvent(self, event) -> None:
+        self._update_geometry()
+        super().resizeEvent(event)
+
     def paintEvent(self, _event) -> None:
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
         rect = self.rect()
-        d = min(rect.width(), rect.height())
+        center = rect.center()
+        r_glow, r_ring, r_inner = self._radii
 
         # Gambar glow
-        p.setPen(QPen(self._ring_glow, 18, Qt.SolidLine, Qt.RoundCap))
-        p.drawEllipse(rect.center(), (d - 18) // 2, (d - 18) // 2)
+        p.setPen(self._glow_pen)
+        p.drawEllipse(center, r_glow, r_glow)
 
         # Gambar ring utama
-        p.setPen(QPen(self._ring_color, 10, Qt.SolidLine, Qt.RoundCap))
-        p.drawEllipse(rect.center(), (d - 36) // 2, (d - 36) // 2)
+        p.setPen(self._ring_pen)
+        p.drawEllipse(center, r_ring, r_ring)
 
         # Gambar lingkaran dalam
-        p.setBrush(self._inner_color)
+        p.setBrush(self._inner_brush)
         p.setPen(Qt.NoPen)
-        p.drawEllipse(rect.center(), (d - 72) // 2, (d - 72) // 2)
+        p.drawEllipse(center, r_inner, r_inner)
 
         # Gambar teks
-        p.setPen(self._text_color)
-        font = QFont("Arial", max(18, int(d * 0.1)), QFont.Bold)
-        p.setFont(font)
+        p.setPen(self._text_pen)
+        p.setFont(self._font)
         p.drawText(rect, Qt.AlignCenter, self._text)
 
     def mousePressEvent(self, event) -> None:
@@ -320,19 +533,170 @@ class CircularScanButton(QWidget):
         super().mousePressEvent(event)
 
 
+class UpdatesModel(QAbstractListModel):
+    """List model holding the scan results, one update dict per row."""
+
+    def __init__(self, items: List[Dict], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._items = items
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.UserRole:
+            return item
+        if role == Qt.DisplayRole:
+            return item['package']
+        return None
+
+
+class UpdateDelegate(QStyledItemDelegate):
+    """Paints a result row (package, versions, Update button) without creating widgets per row."""
+    updateRequested = Signal(str)
+
+    ROW_HEIGHT = 64
+    BUTTON_WIDTH = 96
+    BUTTON_HEIGHT = 36
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._card_brush = QBrush(QColor("#23272e"))
+        self._button_brush = QBrush(QColor("#30363d"))
+        self._button_disabled_brush = QBrush(QColor("#4c5258"))
+        self._text_color = QColor("#eaecef")
+        self._muted_color = QColor("#9a9fa5")
+        self._name_font = QFont("Arial", 10, QFont.Bold)
+        self._small_font = QFont("Arial", 8)
+        self._text_font = QFont("Arial", 9)
+        self._button_font = QFont("Arial", 9, QFont.DemiBold)
+        self._name_metrics = QFontMetrics(self._name_font)
+        self._small_metrics = QFontMetrics(self._small_font)
+        self._text_metrics = QFontMetrics(self._text_font)
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def _button_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.right() - self.BUTTON_WIDTH - 12, rect.center().y() - self.BUTTON_HEIGHT // 2,
+                     self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        item = index.data(Qt.UserRole)
+        enabled = bool(option.state & QStyle.State_Enabled)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = option.rect.adjusted(0, 4, 0, -4)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._card_brush)
+        painter.drawRoundedRect(card, 6, 6)
+
+        # Name column takes 3/5 of the text area, versions the rest (like the old 3:2 layout)
+        button = self._button_rect(card)
+        text_area = QRect(card.left() + 16, card.top() + 6, button.left() - card.left() - 28, card.height() - 12)
+        name_width = text_area.width() * 3 // 5
+        half = text_area.height() // 2
+        name_rect = QRect(text_area.left(), text_area.top(), name_width, half)
+        model_rect = QRect(text_area.left(), text_area.top() + half, name_width, half)
+        version_width = text_area.width() - name_width - 8
+        current_rect = QRect(text_area.left() + name_width + 8, text_area.top(), version_width, half)
+        available_rect = QRect(current_rect.left(), text_area.top() + half, version_width, half)
+
+        # Long package names and versions get an ellipsis instead of being clipped
+        align = Qt.AlignLeft | Qt.AlignVCenter
+        painter.setPen(self._text_color)
+        painter.setFont(self._name_font)
+        painter.drawText(name_rect, align,
+                         self._name_metrics.elidedText(item['package'], Qt.ElideRight, name_rect.width()))
+        painter.setFont(self._small_font)
+        painter.drawText(model_rect, align,
+                         self._small_metrics.elidedText(item.get('model', 'System Package'), Qt.ElideRight,
+                                                        model_rect.width()))
+        painter.setFont(self._text_font)
+        painter.drawText(current_rect, align,
+                         self._text_metrics.elidedText(f"Current: {item['current_version']}", Qt.ElideRight,
+                                                       current_rect.width()))
+        painter.drawText(available_rect, align,
+                         self._text_metrics.elidedText(f"Available: {item['new_version']}", Qt.ElideRight,
+                                                       available_rect.width()))
+
+        painter.setBrush(self._button_brush if enabled else self._button_disabled_brush)
+        painter.drawRoundedRect(button, 6, 6)
+        painter.setPen(self._text_color if enabled else self._muted_color)
+        painter.setFont(self._button_font)
+        painter.drawText(button, Qt.AlignCenter, "Update")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and self._button_rect(option.rect.adjusted(0, 4, 0, -4)).contains(event.position().toPoint())):
+            self.updateRequested.emit(index.data(Qt.UserRole)['package'])
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class DriverUpdaterApp(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Driver Updater")
         self.setGeometry(100, 100, 960, 650)
         self.is_scanning = False
-        self.current_scan_worker = None
+        self._policy_cache: Dict[str, Tuple[str, str]] = {}
+        # Id of the scan whose signals are accepted; bumped on every start and cancel
+        self._scan_generation = 0
+        # Threads of cancelled scans that may still be blocked in apt/pkexec
+        self._retired_scans: List[Tuple[QThread, ScanWorker]] = []
 
         self.setup_styles()
         self.setup_ui()
+        self.setup_scan_worker()
+        QApplication.instance().aboutToQuit.connect(self.shutdown_scan_threads)
         self.create_tray_icon()
         self.check_privileges()
 
+    def setup_scan_worker(self):
+        """Creates the scan thread and worker; scans reuse them until one is cancelled."""
+        self.scan_thread = QThread()
+        self.current_scan_worker = ScanWorker()
+        self.current_scan_worker.moveToThread(self.scan_thread)
+
+        # Hubungkan sinyal
+        self.current_scan_worker.progress.connect(self.update_progress)
+        self.current_scan_worker.log.connect(self.scan_log)
+        self.current_scan_worker.finished.connect(self.finish_scan)
+        self.current_scan_worker.error.connect(self.scan_error)
+
+        self.scan_thread.start()
+
+    def retire_scan_worker(self):
+        """Stops the current worker without waiting for it.
+
+        A cancelled scan can stay blocked (pkexec password prompt, detect.py), so it is
+        left to finish on its own thread and the next scan gets a fresh worker.
+        """
+        self._retired_scans = [(t, w) for t, w in self._retired_scans if t.isRunning()]
+        self.current_scan_worker.stop()
+        self.scan_thread.quit()
+        self._retired_scans.append((self.scan_thread, self.current_scan_worker))
+        self.scan_thread = None
+        self.current_scan_worker = None
+
+    def shutdown_scan_threads(self):
+        scans = list(self._retired_scans)
+        if self.scan_thread is not None:
+            scans.append((self.scan_thread, self.current_scan_worker))
+        for thread, worker in scans:
+            worker.stop()
+            thread.quit()
+        for thread, _worker in scans:
+            # A scan stuck inside detect.py can't be interrupted; don't hang the exit on it
+            if not thread.wait(_SCAN_SHUTDOWN_TIMEOUT_MS):
+                print("Driver Updater: scan thread did not stop in time, exiting anyway.", file=sys.stderr)
+
     def setup_styles(self):
         self.setStyleSheet(
             """
@@ -404,14 +768,6 @@ class DriverUpdaterApp(QMainWindow):
         banner_layout.addWidget(self.banner_text, 1)
         layout.addWidget(self.banner_frame)
         layout.setSpacing(18)
-        self.banner_frame = QFrame()
-        banner_layout = QHBoxLayout(self.banner_frame)
-        self.banner_icon = QLabel("✔")
-        self.banner_text = QLabel("All your drivers are up to date!")
-        self.set_banner_style("ok")
-        banner_layout.addWidget(self.banner_icon)
-        banner_layout.addWidget(self.banner_text, 1)
-        layout.addWidget(self.banner_frame)
 
         center_widget = QWidget()
         center_layout = QVBoxLayout(center_widget)
@@ -429,12 +785,27 @@ class DriverUpdaterApp(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(160)
-        self.log_text.append("System ready. Click SCAN to check for driver updates.")
+        self.log_text.setAcceptRichText(False)
+        self._log_cursor = QTextCursor(self.log_text.document())
+        self._log_append_plain("System ready. Click SCAN to check for driver updates.")
 
         layout.addWidget(self.log_text)
 
         return page
 
+    def _log_append_plain(self, text: str) -> None:
+        """Appends plain text to the log without the HTML processing done by QTextEdit.append."""
+        scrollbar = self.log_text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        self._log_cursor.movePosition(QTextCursor.End)
+        # Like append(): each message is a new paragraph, without a trailing empty line
+        if not self.log_text.document().isEmpty():
+            self._log_cursor.insertText("\n")
+        self._log_cursor.insertText(text)
+        # Only follow the output if the user hasn't scrolled back
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
     def set_banner_style(self, state: str):
         """Set banner style based on status (ok, scanning, error)."""
         styles = {
@@ -457,16 +828,15 @@ class DriverUpdaterApp(QMainWindow):
             )
 
     def _is_command_available(self, cmd: str) -> bool:
-        return subprocess.run(["which", cmd], capture_output=True).returncode == 0
+        return which(cmd) is not None
 
     def toggle_scan(self):
         if self.is_scanning:
-            if self.scan_thread and self.scan_thread.isRunning():
-                self.log_text.append("\n==> Mencoba membatalkan pemindaian...")
-                self.current_scan_worker.stop()
-                self.scan_thread.quit()
-                self.scan_thread.wait(1000)
-                self.reset_scan_state("Pemindaian dibatalkan oleh pengguna.")
+            self._log_append_plain("\n==> Mencoba membatalkan pemindaian...")
+            self._log_append_plain("Received signal to stop...")
+            self._scan_generation += 1  # Ignore anything the cancelled scan still emits
+            self.retire_scan_worker()
+            self.reset_scan_state("Pemindaian dibatalkan oleh pengguna.")
         else:
             self.start_scan()
 
@@ -476,20 +846,18 @@ class DriverUpdaterApp(QMainWindow):
         self.progress_bar.setVisible(True)
         self.log_text.clear()
 
-        self.scan_thread = QThread()
-        self.current_scan_worker = ScanWorker()
-        self.current_scan_worker.moveToThread(self.scan_thread)
-
-        # Hubungkan sinyal
-        self.current_scan_worker.progress.connect(self.update_progress)
-        self.current_scan_worker.log.connect(self.log_text.append)
-        self.current_scan_worker.finished.connect(self.finish_scan)
-        self.current_scan_worker.error.connect(self.scan_error)
-        self.scan_thread.started.connect(self.current_scan_worker.run_scan)
+        if self.scan_thread is None:
+            self.setup_scan_worker()
+        self._scan_generation += 1
+        QMetaObject.invokeMethod(self.current_scan_worker, "run_scan", Qt.QueuedConnection,
+                                 Q_ARG(int, self._scan_generation))
 
-        self.scan_thread.start()
+    def scan_log(self, generation: int, text: str):
+        if generation != self._scan_generation: return
+        self._log_append_plain(text)
 
-    def update_progress(self, value: int, text: str):
+    def update_progress(self, generation: int, value: int, text: str):
+        if generation != self._scan_generation: return  # Stale scan
         self.progress_bar.setValue(value)
         self.progress_bar.setFormat(text)
         self.scan_circle.setText(f"{value}%")
@@ -498,14 +866,18 @@ class DriverUpdaterApp(QMainWindow):
         self.scan_circle.setAccent(QColor("#f39c12"), QColor("#ffb64c"))
         self.set_banner_style("scanning")
 
-    def finish_scan(self, found_updates: List[Dict]):
-        self.log_text.append("\nScan completed.")
+    def finish_scan(self, generation: int, found_updates: List[Dict]):
+        if generation != self._scan_generation: return  # Result of a scan that was cancelled
+        self._log_append_plain("\nScan completed.")
         self.reset_scan_state()
+        # Remember scanned versions so the update step doesn't have to query them again
+        self._policy_cache = {d['package']: (d['current_version'], d['new_version']) for d in found_updates}
         self.create_results_page(found_updates)
         self.stacked_widget.setCurrentWidget(self.results_page)
 
-    def scan_error(self, message: str):
-        self.log_text.append(f"\nERROR: {message}")
+    def scan_error(self, generation: int, message: str):
+        if generation != self._scan_generation: return  # Result of a scan that was cancelled
+        self._log_append_plain(f"\nERROR: {message}")
         self.set_banner_style("error")
         self.scan_circle.setAccent(QColor("#e74c3c"), QColor("#ff6868")) # Merah untuk error
         self.reset_scan_state(message)
@@ -516,10 +888,6 @@ class DriverUpdaterApp(QMainWindow):
         self.progress_bar.setVisible(False)
         self.progress_bar.setValue(0)
 
-        if hasattr(self, 'scan_thread') and self.scan_thread.isRunning():
-            self.scan_thread.quit()
-            self.scan_thread.wait()
-
         if message:
             self.banner_text.setText(message)
         else:
@@ -552,22 +920,24 @@ class DriverUpdaterApp(QMainWindow):
             header_layout.addWidget(update_all_btn)
         layout.addLayout(header_layout)
 
-        # Daftar yang dapat digulir
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("background: transparent; border: none;")
-        list_container = QWidget()
-        list_layout = QVBoxLayout(list_container)
-
+        # Results are painted by a delegate, so rows don't cost a widget tree each
+        self.updates_view = None
         if n_updates:
-            for item in found_updates:
-                list_layout.addWidget(self.create_driver_item_widget(item))
+            self.updates_view = QListView()
+            self.updates_view.setStyleSheet("background: transparent; border: none;")
+            self.updates_view.setSelectionMode(QAbstractItemView.NoSelection)
+            self.updates_view.setFocusPolicy(Qt.NoFocus)
+            self.updates_view.setUniformItemSizes(True)
+            self.updates_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+            self.updates_model = UpdatesModel(found_updates, self.results_page)
+            delegate = UpdateDelegate(self.updates_view)
+            delegate.updateRequested.connect(lambda pkg: self.start_update([pkg]))
+            self.updates_view.setModel(self.updates_model)
+            self.updates_view.setItemDelegate(delegate)
+            layout.addWidget(self.updates_view, 1)
         else:
-            list_layout.addWidget(QLabel("No driver updates are currently available."))
-
-        list_layout.addStretch(1)
-        scroll_area.setWidget(list_container)
-        layout.addWidget(scroll_area, 1)
+            layout.addWidget(QLabel("No driver updates are currently available."))
+            layout.addStretch(1)
 
         # Tambahkan kembali log text
         layout.addWidget(self.log_text)
@@ -580,28 +950,11 @@ class DriverUpdaterApp(QMainWindow):
 
         self.stacked_widget.addWidget(self.results_page)
 
-    def create_driver_item_widget(self, item_data: Dict) -> QFrame:
-        """Creates a widget for each driver item in the results list."""
-        frame = QFrame()
-        frame.setStyleSheet("background-color: #23272e; border-radius: 6px; padding: 8px;")
-        layout = QHBoxLayout(frame)
-
-        pkg = item_data['package']
-        name_label = QLabel(f"<b>{pkg}</b><br><small>{item_data.get('model', 'System Package')}</small>")
-        version_label = QLabel(f"Current: {item_data['current_version']}<br>Available: {item_data['new_version']}")
-
-        update_btn = QPushButton("Update")
-        update_btn.clicked.connect(lambda: self.start_update([pkg]))
-
-        layout.addWidget(name_label, 3)
-        layout.addWidget(version_label, 2)
-        layout.addWidget(update_btn, 1)
-        return frame
-
     def go_to_scan_page(self):
         """Return to the scan page."""
         self.log_text.clear()
-        self.log_text.append("System ready. Click SCAN to start again.")
+        self._log_append_plain("System ready. Click SCAN to start again.")
+        self._policy_cache = {}
         self.reset_scan_state()
         self.stacked_widget.setCurrentWidget(self.scan_page)
 
@@ -615,27 +968,32 @@ class DriverUpdaterApp(QMainWindow):
                          QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.No: return
 
-        self.log_text.append(f"\n>>> Starting update process for: {', '.join(packages)}")
+        self._log_append_plain(f"\n>>> Starting update process for: {', '.join(packages)}")
 
         # Nonaktifkan tombol untuk mencegah klik ganda
         for btn in self.results_page.findChildren(QPushButton):
             btn.setEnabled(False)
+        if self.updates_view is not None:
+            self.updates_view.setEnabled(False)
 
         self.update_thread = QThread()
         self.update_worker = UpdateWorker()
         self.update_worker.moveToThread(self.update_thread)
 
-        self.update_worker.log.connect(self.log_text.append)
+        self.update_worker.log.connect(self._log_append_plain)
         self.update_worker.finished.connect(self.finish_update)
-        self.update_thread.started.connect(lambda: self.update_worker.run_update(packages))
+        policy_cache = dict(self._policy_cache)
+        self.update_thread.started.connect(lambda: self.update_worker.run_update(packages, policy_cache))
 
         self.update_thread.start()
 
     def finish_update(self, success: bool, message: str):
         """Called after the update thread finishes."""
-        self.log_text.append(f">>> {message}")
+        self._log_append_plain(f">>> {message}")
 
         if success:
+            # Installed versions changed; don't reuse the scan results for the next update
+            self._policy_cache = {}
             QMessageBox.information(self, "Update Complete", message)
             # Check if reboot is recommended
             if any(k in message for k in ["linux-", "kernel", "nvidia"]):
@@ -647,14 +1005,15 @@ class DriverUpdaterApp(QMainWindow):
         # Re-enable buttons on the results page
         for btn in self.results_page.findChildren(QPushButton):
             btn.setEnabled(True)
+        if self.updates_view is not None:
+            self.updates_view.setEnabled(True)
 
         self.update_thread.quit()
         self.update_thread.wait()
 
     # --- Manajemen Tray Icon dan Jendela ---
     def create_tray_icon(self):
-        icon_path = os.path.join(os.path.dirname(__file__), "icon.png")  # Ganti dengan icon.svg jika perlu
-        app_icon = QIcon(icon_path) if os.path.exists(icon_path) else self.style().standardIcon(QStyle.SP_ComputerIcon)
+        app_icon = _get_app_icon()
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.tray_icon = QSystemTrayIcon(app_icon, self)
             menu = QMenu()
@@ -683,13 +1042,7 @@ class DriverUpdaterApp(QMainWindow):
 def main() -> None:
     app = QApplication(sys.argv)
     # Set global app icon (shows in taskbar/dock and some DEs)
-    icon_path = os.path.join(os.path.dirname(__file__), "icon.png")  # Ganti dengan icon.svg jika perlu
-    if os.path.exists(icon_path):
-        app_icon = QIcon(icon_path)
-        app.setWindowIcon(app_icon)
-    else:
-        app_icon = app.style().standardIcon(QStyle.SP_ComputerIcon)
-        app.setWindowIcon(app_icon)
+    app.setWindowIcon(_get_app_icon())
     app.setQuitOnLastWindowClosed(False)
     window = DriverUpdaterApp()
     window.show()